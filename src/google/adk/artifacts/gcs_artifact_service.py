@@ -15,8 +15,10 @@
 """An artifact service implementation using Google Cloud Storage (GCS)."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
+import weakref
 
 from google.cloud import storage
 from google.genai import types
@@ -40,6 +42,11 @@ class GcsArtifactService(BaseArtifactService):
     self.bucket_name = bucket_name
     self.storage_client = storage.Client(**kwargs)
     self.bucket = self.storage_client.bucket(self.bucket_name)
+    # Serializes version allocation per artifact, keyed by its blob prefix.
+    # Entries disappear once no coroutine holds the lock.
+    self._artifact_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+        weakref.WeakValueDictionary()
+    )
 
   def _file_has_user_namespace(self, filename: str) -> bool:
     """Checks if the filename has a user namespace.
@@ -77,6 +84,41 @@ class GcsArtifactService(BaseArtifactService):
       return f"{app_name}/{user_id}/user/{filename}/{version}"
     return f"{app_name}/{user_id}/{session_id}/{filename}/{version}"
 
+  def _get_artifact_lock(
+      self, app_name: str, user_id: str, session_id: str, filename: str
+  ) -> asyncio.Lock:
+    """Returns the lock guarding the versions of an artifact.
+
+    Args:
+        app_name: The name of the application.
+        user_id: The ID of the user.
+        session_id: The ID of the session.
+        filename: The name of the artifact file.
+
+    Returns:
+        The asyncio.Lock shared by all callers for this artifact.
+    """
+    prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
+    lock = self._artifact_locks.get(prefix)
+    if lock is None:
+      lock = asyncio.Lock()
+      self._artifact_locks[prefix] = lock
+    return lock
+
+  def _list_blob_names(self, prefix: str) -> list[str]:
+    """Lists the names of the blobs under a prefix (blocking).
+
+    Args:
+        prefix: The blob name prefix to list.
+
+    Returns:
+        The names of the matching blobs.
+    """
+    return [
+        blob.name
+        for blob in self.storage_client.list_blobs(self.bucket, prefix=prefix)
+    ]
+
   @override
   async def save_artifact(
       self,
@@ -87,23 +129,28 @@ class GcsArtifactService(BaseArtifactService):
       filename: str,
       artifact: types.Part,
   ) -> int:
-    versions = await self.list_versions(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    version = 0 if not versions else max(versions) + 1
+    # The GCS calls run in threads so they don't block the event loop. Hold
+    # the artifact lock from picking the version until the blob exists, so
+    # concurrent saves of the same artifact get distinct versions.
+    async with self._get_artifact_lock(app_name, user_id, session_id, filename):
+      versions = await self.list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
+      )
+      version = 0 if not versions else max(versions) + 1
 
-    blob_name = self._get_blob_name(
-        app_name, user_id, session_id, filename, version
-    )
-    blob = self.bucket.blob(blob_name)
+      blob_name = self._get_blob_name(
+          app_name, user_id, session_id, filename, version
+      )
+      blob = self.bucket.blob(blob_name)
 
-    blob.upload_from_string(
-        data=artifact.inline_data.data,
-        content_type=artifact.inline_data.mime_type,
-    )
+      await asyncio.to_thread(
+          blob.upload_from_string,
+          data=artifact.inline_data.data,
+          content_type=artifact.inline_data.mime_type,
+      )
 
     return version
 
@@ -133,7 +180,7 @@ class GcsArtifactService(BaseArtifactService):
     )
     blob = self.bucket.blob(blob_name)
 
-    artifact_bytes = blob.download_as_bytes()
+    artifact_bytes = await asyncio.to_thread(blob.download_as_bytes)
     if not artifact_bytes:
       return None
     artifact = types.Part.from_bytes(
@@ -148,19 +195,13 @@ class GcsArtifactService(BaseArtifactService):
     filenames = set()
 
     session_prefix = f"{app_name}/{user_id}/{session_id}/"
-    session_blobs = self.storage_client.list_blobs(
-        self.bucket, prefix=session_prefix
-    )
-    for blob in session_blobs:
-      *_, filename, _ = blob.name.split("/")
-      filenames.add(filename)
-
     user_namespace_prefix = f"{app_name}/{user_id}/user/"
-    user_namespace_blobs = self.storage_client.list_blobs(
-        self.bucket, prefix=user_namespace_prefix
+    session_blob_names, user_namespace_blob_names = await asyncio.gather(
+        asyncio.to_thread(self._list_blob_names, session_prefix),
+        asyncio.to_thread(self._list_blob_names, user_namespace_prefix),
     )
-    for blob in user_namespace_blobs:
-      *_, filename, _ = blob.name.split("/")
+    for blob_name in session_blob_names + user_namespace_blob_names:
+      *_, filename, _ = blob_name.split("/")
       filenames.add(filename)
 
     return sorted(list(filenames))
@@ -169,18 +210,23 @@ class GcsArtifactService(BaseArtifactService):
   async def delete_artifact(
       self, *, app_name: str, user_id: str, session_id: str, filename: str
   ) -> None:
-    versions = await self.list_versions(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id,
-        filename=filename,
-    )
-    for version in versions:
-      blob_name = self._get_blob_name(
-          app_name, user_id, session_id, filename, version
+    async with self._get_artifact_lock(app_name, user_id, session_id, filename):
+      versions = await self.list_versions(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=session_id,
+          filename=filename,
       )
-      blob = self.bucket.blob(blob_name)
-      blob.delete()
+      await asyncio.gather(*(
+          asyncio.to_thread(
+              self.bucket.blob(
+                  self._get_blob_name(
+                      app_name, user_id, session_id, filename, version
+                  )
+              ).delete
+          )
+          for version in versions
+      ))
     return
 
   @override
@@ -188,9 +234,9 @@ class GcsArtifactService(BaseArtifactService):
       self, *, app_name: str, user_id: str, session_id: str, filename: str
   ) -> list[int]:
     prefix = self._get_blob_name(app_name, user_id, session_id, filename, "")
-    blobs = self.storage_client.list_blobs(self.bucket, prefix=prefix)
+    blob_names = await asyncio.to_thread(self._list_blob_names, prefix)
     versions = []
-    for blob in blobs:
-      _, _, _, _, version = blob.name.split("/")
+    for blob_name in blob_names:
+      _, _, _, _, version = blob_name.split("/")
       versions.append(int(version))
     return versions
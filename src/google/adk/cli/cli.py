@@ -14,7 +14,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+import sys
 from typing import Optional
 
 import click
@@ -74,6 +76,43 @@ async def run_input_file(
   return session
 
 
+async def _read_user_input(prompt: str) -> str:
+  """Reads a line from an interactive stdin without blocking the event loop.
+
+  When stdin is a terminal the event loop waits for it to become readable, so
+  a pending prompt can be cancelled (e.g. on Ctrl-C) without leaving a thread
+  blocked in input(). Otherwise, or where the loop can't watch stdin, this
+  falls back to a plain input() call.
+  """
+  loop = asyncio.get_running_loop()
+  readable = loop.create_future()
+
+  def _on_readable() -> None:
+    if not readable.done():
+      readable.set_result(None)
+
+  try:
+    if not sys.stdin.isatty():
+      return input(prompt)
+    fd = sys.stdin.fileno()
+    loop.add_reader(fd, _on_readable)
+  except (AttributeError, NotImplementedError, OSError, ValueError):
+    return input(prompt)
+
+  try:
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    await readable
+  finally:
+    loop.remove_reader(fd)
+  # A terminal in canonical mode only becomes readable once a full line has
+  # been entered, and each read returns at most that one line.
+  line = sys.stdin.readline()
+  if not line:
+    raise EOFError
+  return line.rstrip('\n')
+
+
 async def run_interactively(
     root_agent: LlmAgent,
     artifact_service: BaseArtifactService,
@@ -89,7 +128,7 @@ async def run_interactively(
       credential_service=credential_service,
   )
   while True:
-    query = input('[user]: ')
+    query = await _read_user_input('[user]: ')
     if not query or not query.strip():
       continue
     if query == 'exit':
@@ -438,10 +438,13 @@ def cli_eval(
     else:
       eval_run_summary[eval_result.eval_set_id][1] += 1
   print("Eval Run Summary")
-  for eval_set_id, pass_fail_count in eval_run_summary.items():
+  if eval_run_summary:
     print(
-        f"{eval_set_id}:\n  Tests passed: {pass_fail_count[0]}\n  Tests"
-        f" failed: {pass_fail_count[1]}"
+        "\n".join(
+            f"{eval_set_id}:\n  Tests passed: {pass_fail_count[0]}\n  Tests"
+            f" failed: {pass_fail_count[1]}"
+            for eval_set_id, pass_fail_count in eval_run_summary.items()
+        )
     )
 
   if print_detailed_results:
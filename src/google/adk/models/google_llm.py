@@ -109,8 +109,11 @@ class Gemini(BaseLlm):
           config=llm_request.config,
       )
       response = None
-      thought_text = ''
-      text = ''
+      # Accumulate streamed text as lists and join once per aggregated
+      # response, so long streams stay linear instead of re-copying the
+      # growing string on every chunk.
+      thought_text_parts: list[str] = []
+      text_parts: list[str] = []
       usage_metadata = None
       # for sse, similar as bidi (see receive method in gemini_llm_connecton.py),
       # we need to mark those text content as partial and after all partial
@@ -128,39 +131,43 @@ class Gemini(BaseLlm):
         ):
           part0 = llm_response.content.parts[0]
           if part0.thought:
-            thought_text += part0.text
+            thought_text_parts.append(part0.text)
           else:
-            text += part0.text
+            text_parts.append(part0.text)
           llm_response.partial = True
-        elif (thought_text or text) and (
+        elif (thought_text_parts or text_parts) and (
             not llm_response.content
             or not llm_response.content.parts
             # don't yield the merged text event when receiving audio data
             or not llm_response.content.parts[0].inline_data
         ):
           parts = []
-          if thought_text:
-            parts.append(types.Part(text=thought_text, thought=True))
-          if text:
-            parts.append(types.Part.from_text(text=text))
+          if thought_text_parts:
+            parts.append(
+                types.Part(text=''.join(thought_text_parts), thought=True)
+            )
+          if text_parts:
+            parts.append(types.Part.from_text(text=''.join(text_parts)))
           yield LlmResponse(
               content=types.ModelContent(parts=parts),
               usage_metadata=llm_response.usage_metadata,
           )
-          thought_text = ''
-          text = ''
+          thought_text_parts.clear()
+          text_parts.clear()
         yield llm_response
       if (
-          (text or thought_text)
+          (text_parts or thought_text_parts)
           and response
           and response.candidates
           and response.candidates[0].finish_reason == types.FinishReason.STOP
       ):
         parts = []
-        if thought_text:
-          parts.append(types.Part(text=thought_text, thought=True))
-        if text:
-          parts.append(types.Part.from_text(text=text))
+        if thought_text_parts:
+          parts.append(
+              types.Part(text=''.join(thought_text_parts), thought=True)
+          )
+        if text_parts:
+          parts.append(types.Part.from_text(text=''.join(text_parts)))
         yield LlmResponse(
             content=types.ModelContent(parts=parts),
             usage_metadata=usage_metadata,
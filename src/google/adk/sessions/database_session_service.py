@@ -483,20 +483,22 @@ class DatabaseSessionService(BaseSessionService):
       self, *, app_name: str, user_id: str
   ) -> ListSessionsResponse:
     with self.database_session_factory() as session_factory:
+      # Only select the columns the listing needs so the state blobs are never
+      # loaded from the database.
       results = (
-          session_factory.query(StorageSession)
+          session_factory.query(StorageSession.id, StorageSession.update_time)
           .filter(StorageSession.app_name == app_name)
           .filter(StorageSession.user_id == user_id)
           .all()
       )
       sessions = []
-      for storage_session in results:
+      for session_id, update_time in results:
         session = Session(
             app_name=app_name,
             user_id=user_id,
-            id=storage_session.id,
+            id=session_id,
             state={},
-            last_update_time=storage_session.update_time.timestamp(),
+            last_update_time=update_time.timestamp(),
         )
         sessions.append(session)
       return ListSessionsResponse(sessions=sessions)
@@ -216,12 +216,17 @@ class InMemorySessionService(BaseSessionService):
     if user_id not in self.sessions[app_name]:
       return empty_response
 
-    sessions_without_events = []
-    for session in self.sessions[app_name][user_id].values():
-      copied_session = copy.deepcopy(session)
-      copied_session.events = []
-      copied_session.state = {}
-      sessions_without_events.append(copied_session)
+    # Only the session headers are returned, so build them directly instead
+    # of deep-copying the events and state just to discard them.
+    sessions_without_events = [
+        Session(
+            app_name=session.app_name,
+            user_id=session.user_id,
+            id=session.id,
+            last_update_time=session.last_update_time,
+        )
+        for session in self.sessions[app_name][user_id].values()
+    ]
     return ListSessionsResponse(sessions=sessions_without_events)
 
   @override
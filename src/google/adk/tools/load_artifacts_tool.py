@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 from typing import TYPE_CHECKING
@@ -95,8 +96,12 @@ class LoadArtifactsTool(BaseTool):
       function_response = llm_request.contents[-1].parts[0].function_response
       if function_response and function_response.name == 'load_artifacts':
         artifact_names = function_response.response['artifact_names']
-        for artifact_name in artifact_names:
-          artifact = await tool_context.load_artifact(artifact_name)
+        # Load all requested artifacts concurrently; gather keeps the order.
+        artifacts = await asyncio.gather(*(
+            tool_context.load_artifact(artifact_name)
+            for artifact_name in artifact_names
+        ))
+        for artifact_name, artifact in zip(artifact_names, artifacts):
           llm_request.contents.append(
               types.Content(
                   role='user',
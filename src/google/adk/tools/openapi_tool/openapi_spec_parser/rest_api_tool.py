@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import atexit
+import http.cookiejar
 from typing import Any
 from typing import Dict
 from typing import List
@@ -63,6 +65,33 @@ def snake_to_lower_camel(snake_case_string: str):
 
 AuthPreparationState = Literal["pending", "done"]
 
+# Shared across all RestApiTool instances so repeated calls reuse keep-alive
+# connections instead of paying a fresh TCP/TLS handshake per request.
+_SHARED_SESSION: Optional[requests.Session] = None
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 20
+
+
+def _get_session() -> requests.Session:
+  """Returns the process-wide pooled requests session, creating it lazily."""
+  global _SHARED_SESSION
+  if _SHARED_SESSION is None:
+    session = requests.Session()
+    # The session is shared across tools, agents and users, so it must not
+    # remember cookies: a Set-Cookie from one call would otherwise be sent on
+    # every later call to that domain.
+    session.cookies.set_policy(
+        http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    atexit.register(session.close)
+    _SHARED_SESSION = session
+  return _SHARED_SESSION
+
 
 class RestApiTool(BaseTool):
   """A generic tool that interacts with a REST API.
@@ -242,7 +271,7 @@ class RestApiTool(BaseTool):
 
     Returns:
         A dictionary containing the  request parameters for the API call. This
-        initializes a requests.request() call.
+        initializes a requests.Session.request() call.
 
     Example:
         self._prepare_request_params({"input_id": "test-id"})
@@ -390,7 +419,7 @@ class RestApiTool(BaseTool):
 
     # Got all parameters. Call the API.
     request_params = self._prepare_request_params(api_params, api_args)
-    response = requests.request(**request_params)
+    response = _get_session().request(**request_params)
 
     # Parse API response
     try:
@@ -14,7 +14,10 @@
 
 """Tests for the artifact service."""
 
+import asyncio
 import enum
+import threading
+import time
 from typing import Optional
 from typing import Union
 from unittest import mock
@@ -136,6 +139,30 @@ class MockClient:
     return list(bucket.blobs.values())
 
 
+class SlowUploadMockBlob(MockBlob):
+  """A MockBlob that only appears in its bucket once its slow upload ends."""
+
+  def __init__(self, name: str, bucket: MockBucket) -> None:
+    super().__init__(name)
+    self.bucket = bucket
+
+  def upload_from_string(
+      self, data: Union[str, bytes], content_type: Optional[str] = None
+  ) -> None:
+    time.sleep(0.05)
+    super().upload_from_string(data, content_type)
+    self.bucket.blobs[self.name] = self
+
+
+class SlowUploadMockBucket(MockBucket):
+  """A MockBucket whose blobs are only created by uploading to them."""
+
+  def blob(self, blob_name: str) -> MockBlob:
+    if blob_name in self.blobs:
+      return self.blobs[blob_name]
+    return SlowUploadMockBlob(blob_name, self)
+
+
 def mock_gcs_artifact_service():
   with mock.patch("google.cloud.storage.Client", return_value=MockClient()):
     service = GcsArtifactService(bucket_name="test_bucket")
@@ -278,3 +305,72 @@ async def test_list_versions(service_type):
   )
 
   assert response_versions == list(range(3))
+
+
+@pytest.mark.asyncio
+async def test_gcs_concurrent_saves_get_distinct_versions():
+  """Tests that concurrent saves of one artifact don't overwrite each other."""
+  artifact_service = mock_gcs_artifact_service()
+  artifact_service.bucket = SlowUploadMockBucket("test_bucket")
+  artifacts = [
+      types.Part.from_bytes(data=data, mime_type="text/plain")
+      for data in (b"first", b"second")
+  ]
+
+  versions = await asyncio.gather(*(
+      artifact_service.save_artifact(
+          app_name="app0",
+          user_id="user0",
+          session_id="123",
+          filename="file456",
+          artifact=artifact,
+      )
+      for artifact in artifacts
+  ))
+
+  assert sorted(versions) == [0, 1]
+  for version, artifact in zip(versions, artifacts):
+    assert (
+        await artifact_service.load_artifact(
+            app_name="app0",
+            user_id="user0",
+            session_id="123",
+            filename="file456",
+            version=version,
+        )
+        == artifact
+    )
+
+
+@pytest.mark.asyncio
+async def test_gcs_listing_runs_off_the_event_loop():
+  """Tests that listing blobs doesn't run on the event loop thread."""
+  artifact_service = mock_gcs_artifact_service()
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="file456",
+      artifact=types.Part.from_bytes(data=b"data", mime_type="text/plain"),
+  )
+  list_blobs = artifact_service.storage_client.list_blobs
+  listing_threads = []
+
+  def recording_list_blobs(*args, **kwargs):
+    listing_threads.append(threading.current_thread())
+    return list_blobs(*args, **kwargs)
+
+  artifact_service.storage_client.list_blobs = recording_list_blobs
+
+  await artifact_service.load_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="file456"
+  )
+  await artifact_service.list_artifact_keys(
+      app_name="app0", user_id="user0", session_id="123"
+  )
+  await artifact_service.delete_artifact(
+      app_name="app0", user_id="user0", session_id="123", filename="file456"
+  )
+
+  assert listing_threads
+  assert threading.main_thread() not in listing_threads
@@ -16,9 +16,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
 import json
+import os
 from pathlib import Path
 from textwrap import dedent
+import sys
+import threading
 import types
 from typing import Any
 from typing import Dict
@@ -221,3 +226,77 @@ async def test_run_interactively_whitespace_and_exit(
 
   # verify: assistant echoed once with 'echo:hello'
   assert any("echo:hello" in m for m in echoed)
+
+
+@pytest.fixture
+def _tty_stdin(monkeypatch: pytest.MonkeyPatch):
+  """Replace stdin with a pseudo-terminal and yield its master fd."""
+  pty = pytest.importorskip("pty")
+  master_fd, slave_fd = pty.openpty()
+  stdin = open(slave_fd, "r", encoding="utf-8")
+  monkeypatch.setattr(sys, "stdin", stdin)
+  monkeypatch.setattr(sys, "stdout", io.StringIO())
+  yield master_fd
+  stdin.close()
+  os.close(master_fd)
+
+
+@pytest.mark.asyncio
+async def test_run_interactively_reads_from_terminal(
+    _tty_stdin: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  """run_interactively should read queries from a terminal stdin."""
+  session_service = cli.InMemorySessionService()
+  sess = await session_service.create_session(app_name="dummy", user_id="u")
+  artifact_service = cli.InMemoryArtifactService()
+  credential_service = cli.InMemoryCredentialService()
+  root_agent = types.SimpleNamespace(name="root")
+
+  echoed: list[str] = []
+  monkeypatch.setattr(click, "echo", lambda msg: echoed.append(msg))
+
+  task = asyncio.create_task(
+      cli.run_interactively(
+          root_agent,
+          artifact_service,
+          sess,
+          session_service,
+          credential_service,
+      )
+  )
+  await asyncio.sleep(0.1)
+  os.write(_tty_stdin, b"hello\n")
+  await asyncio.sleep(0.1)
+  os.write(_tty_stdin, b"exit\n")
+  await asyncio.wait_for(task, timeout=5)
+
+  assert any("echo:hello" in m for m in echoed)
+
+
+@pytest.mark.asyncio
+async def test_run_interactively_cancel_while_waiting_for_input(
+    _tty_stdin: int,
+) -> None:
+  """Cancelling run_interactively at the prompt (e.g. Ctrl-C) should exit."""
+  session_service = cli.InMemorySessionService()
+  sess = await session_service.create_session(app_name="dummy", user_id="u")
+  artifact_service = cli.InMemoryArtifactService()
+  credential_service = cli.InMemoryCredentialService()
+  root_agent = types.SimpleNamespace(name="root")
+  threads_before = threading.active_count()
+
+  task = asyncio.create_task(
+      cli.run_interactively(
+          root_agent,
+          artifact_service,
+          sess,
+          session_service,
+          credential_service,
+      )
+  )
+  await asyncio.sleep(0.1)
+  # no thread is left blocked reading stdin
+  assert threading.active_count() == threads_before
+  task.cancel()
+  with pytest.raises(asyncio.CancelledError):
+    await asyncio.wait_for(task, timeout=5)
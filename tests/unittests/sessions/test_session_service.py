@@ -95,17 +95,44 @@ async def test_create_and_list_sessions(service_type):
   user_id = 'test_user'
 
   session_ids = ['session' + str(i) for i in range(5)]
+  last_update_times = {}
   for session_id in session_ids:
-    await session_service.create_session(
+    session = await session_service.create_session(
+        app_name=app_name,
+        user_id=user_id,
+        session_id=session_id,
+        state={'key': 'value' + session_id},
+    )
+    await session_service.append_event(
+        session=session,
+        event=Event(
+            invocation_id='invocation',
+            author='user',
+            content=types.Content(
+                role='user', parts=[types.Part(text='test_text')]
+            ),
+        ),
+    )
+    stored_session = await session_service.get_session(
         app_name=app_name, user_id=user_id, session_id=session_id
     )
+    last_update_times[session_id] = stored_session.last_update_time
 
   list_sessions_response = await session_service.list_sessions(
       app_name=app_name, user_id=user_id
   )
   sessions = list_sessions_response.sessions
+  assert len(sessions) == len(session_ids)
   for i in range(len(sessions)):
     assert sessions[i].id == session_ids[i]
+    assert sessions[i].app_name == app_name
+    assert sessions[i].user_id == user_id
+    # Listings only carry session headers.
+    assert sessions[i].state == {}
+    assert sessions[i].events == []
+    assert sessions[i].last_update_time == pytest.approx(
+        last_update_times[session_ids[i]]
+    )
 
 
 @pytest.mark.asyncio
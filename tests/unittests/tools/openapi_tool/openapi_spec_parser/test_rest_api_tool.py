@@ -13,7 +13,9 @@
 # limitations under the License.
 
 
+import http.server
 import json
+import threading
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -28,6 +30,9 @@ from google.adk.tools.openapi_tool.auth.auth_helpers import token_to_scheme_cred
 from google.adk.tools.openapi_tool.common.common import ApiParameter
 from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_spec_parser import OperationEndpoint
 from google.adk.tools.openapi_tool.openapi_spec_parser.operation_parser import OperationParser
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import _get_session
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import _POOL_CONNECTIONS
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import _POOL_MAXSIZE
 from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
 from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import snake_to_lower_camel
 from google.adk.tools.tool_context import ToolContext
@@ -193,7 +198,7 @@ class TestRestApiTool:
     assert isinstance(declaration.parameters, Schema)
 
   @patch(
-      "google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool.requests.request"
+      "google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool.requests.Session.request"
   )
   @pytest.mark.asyncio
   async def test_call_success(
@@ -225,7 +230,7 @@ class TestRestApiTool:
     assert result == {"result": "success"}
 
   @patch(
-      "google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool.requests.request"
+      "google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool.requests.Session.request"
   )
   @pytest.mark.asyncio
   async def test_call_auth_pending(
@@ -786,3 +791,54 @@ def test_snake_to_lower_camel():
   assert snake_to_lower_camel("three_word_example") == "threeWordExample"
   assert not snake_to_lower_camel("")
   assert snake_to_lower_camel("alreadyCamelCase") == "alreadyCamelCase"
+
+
+@pytest.fixture
+def cookie_server():
+  """Serves /login, which sets a cookie, and /echo, which echoes cookies."""
+
+  class _Handler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+      body = json.dumps({"cookie": self.headers.get("Cookie")}).encode()
+      self.send_response(200)
+      if self.path == "/login":
+        self.send_header("Set-Cookie", "sid=userA; Path=/")
+      self.send_header("Content-Type", "application/json")
+      self.send_header("Content-Length", str(len(body)))
+      self.end_headers()
+      self.wfile.write(body)
+
+    def log_message(self, *args):
+      pass
+
+  server = http.server.HTTPServer(("127.0.0.1", 0), _Handler)
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  yield f"http://127.0.0.1:{server.server_address[1]}"
+  server.shutdown()
+  server.server_close()
+
+
+def test_get_session_uses_configured_pool():
+  adapter = _get_session().get_adapter("https://example.com")
+  assert adapter._pool_connections == _POOL_CONNECTIONS
+  assert adapter._pool_maxsize == _POOL_MAXSIZE
+
+
+def test_get_session_does_not_persist_cookies(cookie_server):
+  session = _get_session()
+
+  session.get(f"{cookie_server}/login", timeout=5)
+  response = session.get(f"{cookie_server}/echo", timeout=5)
+
+  assert response.json() == {"cookie": None}
+  assert not session.cookies
+
+
+def test_get_session_sends_request_cookies(cookie_server):
+  response = _get_session().get(
+      f"{cookie_server}/echo", cookies={"token": "abc"}, timeout=5
+  )
+
+  assert response.json() == {"cookie": "token=abc"}
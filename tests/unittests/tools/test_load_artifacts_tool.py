@@ -0,0 +1,67 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+from google.adk.models.llm_request import LlmRequest
+from google.adk.tools.load_artifacts_tool import load_artifacts_tool
+from google.genai import types
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_process_llm_request_appends_artifacts_in_request_order():
+  artifact_names = ['first.txt', 'second.txt', 'third.txt']
+  # Earlier names take longer to load, so the loads finish in reverse order.
+  delays = {'first.txt': 0.03, 'second.txt': 0.02, 'third.txt': 0.01}
+  completed = []
+
+  async def load_artifact(artifact_name):
+    await asyncio.sleep(delays[artifact_name])
+    completed.append(artifact_name)
+    return types.Part.from_text(text=f'content of {artifact_name}')
+
+  tool_context = MagicMock()
+  tool_context.list_artifacts = AsyncMock(return_value=artifact_names)
+  tool_context.load_artifact = load_artifact
+  llm_request = LlmRequest(
+      contents=[
+          types.Content(
+              role='user',
+              parts=[
+                  types.Part(
+                      function_response=types.FunctionResponse(
+                          name='load_artifacts',
+                          response={'artifact_names': artifact_names},
+                      )
+                  )
+              ],
+          )
+      ]
+  )
+
+  await load_artifacts_tool.process_llm_request(
+      tool_context=tool_context, llm_request=llm_request
+  )
+
+  assert completed == list(reversed(artifact_names))
+  appended = llm_request.contents[1:]
+  assert [content.parts[0].text for content in appended] == [
+      f'Artifact {artifact_name} is:' for artifact_name in artifact_names
+  ]
+  assert [content.parts[1].text for content in appended] == [
+      f'content of {artifact_name}' for artifact_name in artifact_names
+  ]